@@ -26,9 +26,22 @@ Technologies:
 """
 
 import csv
-import random
-from datetime import datetime, timedelta
-from typing import List, Dict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Dict, Optional
+
+import numpy as np
+
+try:
+    from numba import get_num_threads, njit, prange
+except ImportError:  # Numba is optional; NumPy fallbacks are used instead
+    njit = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # PyArrow is optional; the csv module is used instead
+    pa = None
 
 
 class Employee:
@@ -44,6 +57,10 @@ class Employee:
         performance_score (float): Performance rating (1.0 to 10.0)
     """
     
+    # Fixed attribute set: no per-instance __dict__, faster attribute access
+    __slots__ = ('emp_id', 'name', 'department', 'salary',
+                 'joining_date', 'performance_score')
+    
     def __init__(self, emp_id: str, name: str, department: str, 
                  salary: float, joining_date: str, performance_score: float):
         self.emp_id = emp_id
@@ -99,12 +116,14 @@ class EmployeeDataGenerator:
     ]
     
     @staticmethod
-    def generate_employees(num_employees: int = 100) -> List[Employee]:
+    def generate_employees(num_employees: int = 100,
+                           seed: Optional[int] = None) -> List[Employee]:
         """
         Generate specified number of employee records.
         
         Args:
             num_employees (int): Number of employees to generate (default: 100)
+            seed (Optional[int]): Random seed for reproducible data (default: None)
             
         Returns:
             List[Employee]: List of Employee objects with generated data
@@ -115,7 +134,9 @@ class EmployeeDataGenerator:
             >>> len(employees)
             50
         """
-        employees = []
+        gen = EmployeeDataGenerator
+        rng = np.random.Generator(np.random.SFC64(seed))
+        num_employees = max(num_employees, 0)  # Negative counts yield no employees
         
         # Base salaries by department (realistic ranges)
         base_salaries = {
@@ -126,45 +147,144 @@ class EmployeeDataGenerator:
             'Finance': 70000
         }
         
-        for i in range(1, num_employees + 1):
-            # Generate employee ID (e.g., EMP0001, EMP0002, ...)
-            emp_id = f"EMP{i:04d}"
-            
-            # Generate full name
-            first_name = random.choice(EmployeeDataGenerator.FIRST_NAMES)
-            last_name = random.choice(EmployeeDataGenerator.LAST_NAMES)
-            name = f"{first_name} {last_name}"
-            
-            # Assign department
-            department = random.choice(EmployeeDataGenerator.DEPARTMENTS)
-            
-            # Generate salary (base + random variation)
-            base = base_salaries[department]
-            variation = random.randint(-10000, 30000)
-            salary = max(base + variation, 30000)  # Minimum salary: 30000
-            
-            # Generate joining date (within last 5 years)
-            days_ago = random.randint(0, 1825)  # 5 years = ~1825 days
-            joining_date = (datetime.now() - timedelta(days=days_ago)).strftime('%Y-%m-%d')
-            
-            # Generate performance score (5.0 to 10.0)
-            performance_score = round(random.uniform(5.0, 10.0), 1)
-            
-            # Create employee object
-            employee = Employee(
-                emp_id=emp_id,
-                name=name,
-                department=department,
+        # Draw every random column in one batch of num_employees values
+        first_idx = rng.integers(0, len(gen.FIRST_NAMES), num_employees)
+        last_idx = rng.integers(0, len(gen.LAST_NAMES), num_employees)
+        dept_idx = rng.integers(0, len(gen.DEPARTMENTS), num_employees)
+        variations = rng.integers(-10000, 30001, num_employees)
+        days_ago = rng.integers(0, 1826, num_employees)  # 5 years = ~1825 days
+        performance_scores = np.round(rng.uniform(5.0, 10.0, num_employees), 1)  # 5.0 to 10.0
+        
+        # Salary = department base + random variation, minimum salary: 30000
+        base_arr = np.array([base_salaries[dept] for dept in gen.DEPARTMENTS])
+        salaries = np.maximum(base_arr[dept_idx] + variations, 30000)
+        
+        # Joining dates as YYYY-MM-DD strings, formatted in one vectorized call
+        today = np.datetime64(datetime.now().date(), 'D')
+        joining_dates = (today - days_ago.astype('timedelta64[D]')).astype(str)
+        
+        # Assemble Employee objects from the generated columns
+        employees = [
+            Employee(
+                emp_id=f"EMP{i:04d}",  # e.g., EMP0001, EMP0002, ...
+                name=f"{gen.FIRST_NAMES[first]} {gen.LAST_NAMES[last]}",
+                department=gen.DEPARTMENTS[dept],
                 salary=salary,
                 joining_date=joining_date,
                 performance_score=performance_score
             )
-            
-            employees.append(employee)
+            for i, first, last, dept, salary, joining_date, performance_score in zip(
+                range(1, num_employees + 1), first_idx.tolist(), last_idx.tolist(),
+                dept_idx.tolist(), salaries.tolist(), joining_dates.tolist(),
+                performance_scores.tolist()
+            )
+        ]
         
         return employees
 
 
+# Department name -> integer code, used to factorize departments for analysis
+DEPT_INDEX = {dept: i for i, dept in enumerate(EmployeeDataGenerator.DEPARTMENTS)}
+
+
+def _factorize_departments(employees: List[Employee]):
+    """
+    Map each employee's department to a small integer code.
+    
+    Known departments use their DEPT_INDEX code; any other department
+    (e.g. from a loaded CSV) is assigned the next free code. Codes are
+    int8 when they fit, otherwise int32.
+    
+    Returns:
+        tuple: (codes, names) where names[code] is the department name
+    """
+    dept_index = dict(DEPT_INDEX)
+    codes = [dept_index.setdefault(emp.department, len(dept_index)) for emp in employees]
+    dtype = np.int8 if len(dept_index) <= np.iinfo(np.int8).max + 1 else np.int32
+    return np.array(codes, dtype=dtype), list(dept_index)
+
+
+def _dept_agg(codes: np.ndarray, salary: np.ndarray, performance: np.ndarray,
+              num_depts: int):
+    """
+    Aggregate employee count, salary total and performance total per department.
+    
+    Returns:
+        tuple: (counts, salary_totals, performance_totals) arrays indexed by code
+    """
+    counts = np.bincount(codes, minlength=num_depts)
+    salary_totals = np.bincount(codes, weights=salary, minlength=num_depts)
+    performance_totals = np.bincount(codes, weights=performance, minlength=num_depts)
+    return counts, salary_totals, performance_totals
+
+
+if njit is not None:
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _dept_agg_kernel(codes, salary, performance, num_depts, num_chunks):
+        # Each thread accumulates a contiguous chunk of rows into its own row
+        # of partial totals; the partials are reduced at the end
+        n = codes.shape[0]
+        chunk_size = (n + num_chunks - 1) // num_chunks
+        partial_counts = np.zeros((num_chunks, num_depts), np.int64)
+        partial_salary = np.zeros((num_chunks, num_depts))
+        partial_performance = np.zeros((num_chunks, num_depts))
+        for chunk in prange(num_chunks):
+            for i in range(chunk * chunk_size, min(n, (chunk + 1) * chunk_size)):
+                code = codes[i]
+                partial_counts[chunk, code] += 1
+                partial_salary[chunk, code] += salary[i]
+                partial_performance[chunk, code] += performance[i]
+        counts = partial_counts.sum(axis=0)
+        salary_totals = partial_salary.sum(axis=0)
+        performance_totals = partial_performance.sum(axis=0)
+        return counts, salary_totals, performance_totals
+    
+    def _dept_agg(codes, salary, performance, num_depts):
+        # Thread count is read outside the kernel so the compiled code can be cached
+        return _dept_agg_kernel(codes, salary, performance, num_depts, get_num_threads())
+
+
+try:
+    # Precompiled kernel built by kernels.py; skips JIT warmup entirely
+    from emp_kernels import dept_agg as _aot_dept_agg
+except ImportError:
+    _aot_dept_agg = None
+
+
+# Row count from which the parallel JIT kernel is preferred over the
+# single-threaded precompiled one (below it, JIT warmup costs more than it saves)
+AOT_MAX_ROWS = 1_000_000
+
+
+def _aggregate_departments(codes: np.ndarray, salary: np.ndarray,
+                           performance: np.ndarray, num_depts: int):
+    """
+    Pick the department aggregation kernel for the given input.
+    
+    The precompiled kernel is used when its int8 signature matches and
+    either Numba JIT is unavailable or the input is below AOT_MAX_ROWS.
+    """
+    if (_aot_dept_agg is not None and codes.dtype == np.int8
+            and (njit is None or codes.shape[0] < AOT_MAX_ROWS)):
+        return _aot_dept_agg(codes, salary, performance, num_depts)
+    return _dept_agg(codes, salary, performance, num_depts)
+
+
+@dataclass
+class _AnalysisResults:
+    """
+    Aggregates used by generate_report, gathered by _compute_all.
+    
+    Attributes:
+        dept_stats (Dict): Department statistics, as from get_department_statistics
+        bucket_counts (np.ndarray): Employee count per salary range
+        top_idx (np.ndarray): Row indices of top performers, best first
+    """
+    dept_stats: Dict
+    bucket_counts: np.ndarray
+    top_idx: np.ndarray
+
+
 class EmployeeAnalyzer:
     """
     Analyze employee data and generate insights.
@@ -172,8 +292,16 @@ class EmployeeAnalyzer:
     This class provides methods to perform statistical analysis
     on employee data including department-wise statistics,
     performance rankings, and salary distributions.
+    
+    Numeric attributes are copied once into parallel NumPy arrays
+    (structure of arrays) so that aggregations run as vectorized
+    reductions instead of Python loops over Employee objects.
     """
     
+    # Salary range labels and the lower bound of every range after the first
+    SALARY_RANGE_LABELS = ['0-50k', '50k-70k', '70k-90k', '90k-100k', '100k+']
+    SALARY_RANGE_EDGES = np.array([50000, 70000, 90000, 100000])
+    
     def __init__(self, employees: List[Employee]):
         """
         Initialize analyzer with employee data.
@@ -182,6 +310,23 @@ class EmployeeAnalyzer:
             employees (List[Employee]): List of Employee objects to analyze
         """
         self.employees = employees
+        
+        # Parallel column arrays: row i of each array describes employees[i]
+        count = len(employees)
+        self._emp_array = np.empty(count, dtype=object)
+        self._emp_array[:] = employees
+        self.salary = np.fromiter(
+            (emp.salary for emp in employees), dtype=np.float64, count=count
+        )
+        self.performance = np.fromiter(
+            (emp.performance_score for emp in employees), dtype=np.float64, count=count
+        )
+        
+        # Departments are factorized once; aggregation works on codes only
+        self.dept_codes, self.dept_names = _factorize_departments(employees)
+        
+        # Department statistics are computed lazily and reused across calls
+        self._dept_stats = None
     
     def get_department_statistics(self) -> Dict:
         """
@@ -195,31 +340,34 @@ class EmployeeAnalyzer:
                 - total_performance: Sum of performance scores
                 - avg_performance: Average performance score
         """
-        dept_data = {}
+        # Copy so callers cannot modify the cached statistics
+        return {
+            dept: dict(stats) for dept, stats in self._department_statistics().items()
+        }
+    
+    def _department_statistics(self) -> Dict:
+        """Department statistics, computed on first use and cached (do not mutate)."""
+        if self._dept_stats is not None:
+            return self._dept_stats
         
-        # Aggregate data by department
-        for emp in self.employees:
-            dept = emp.department
-            
-            if dept not in dept_data:
-                dept_data[dept] = {
-                    'count': 0,
-                    'total_salary': 0,
-                    'total_performance': 0,
-                    'employees': []
-                }
-            
-            dept_data[dept]['count'] += 1
-            dept_data[dept]['total_salary'] += emp.salary
-            dept_data[dept]['total_performance'] += emp.performance_score
-            dept_data[dept]['employees'].append(emp)
+        counts, salary_totals, performance_totals = _aggregate_departments(
+            self.dept_codes, self.salary, self.performance, len(self.dept_names)
+        )
         
-        # Calculate averages
-        for dept in dept_data:
-            count = dept_data[dept]['count']
-            dept_data[dept]['avg_salary'] = dept_data[dept]['total_salary'] / count
-            dept_data[dept]['avg_performance'] = dept_data[dept]['total_performance'] / count
+        dept_data = {}
         
+        # Calculate averages for departments that have employees
+        for code in np.flatnonzero(counts):
+            count = int(counts[code])
+            dept_data[self.dept_names[code]] = {
+                'count': count,
+                'total_salary': float(salary_totals[code]),
+                'total_performance': float(performance_totals[code]),
+                'avg_salary': float(salary_totals[code]) / count,
+                'avg_performance': float(performance_totals[code]) / count
+            }
+        
+        self._dept_stats = dept_data
         return dept_data
     
     def get_top_performers(self, n: int = 10) -> List[Employee]:
@@ -227,17 +375,28 @@ class EmployeeAnalyzer:
         Get top N performing employees.
         
         Args:
-            n (int): Number of top performers to return (default: 10)
+            n (int): Number of top performers to return (default: 10).
+                A negative n works like a slice stop: all employees except
+                the lowest-ranked |n|.
             
         Returns:
             List[Employee]: Top N employees sorted by performance score
         """
-        sorted_employees = sorted(
-            self.employees, 
-            key=lambda e: e.performance_score, 
-            reverse=True
-        )
-        return sorted_employees[:n]
+        return self._emp_array[self._top_indices(n)].tolist()
+    
+    def _top_indices(self, n: int) -> np.ndarray:
+        """Row indices of the top N performance scores, best first."""
+        # Same count as ranked[:n] on the full ranking, including negative n
+        k = len(range(len(self.performance))[:n])
+        if k <= 0:
+            return np.empty(0, dtype=np.intp)
+        
+        # Find the k-th largest score in linear time, then stable-sort only the
+        # rows at or above it so ties keep their original order, as sorted() did
+        threshold = np.partition(self.performance, -k)[-k]
+        candidates = np.flatnonzero(self.performance >= threshold)
+        order = np.argsort(-self.performance[candidates], kind='stable')
+        return candidates[order][:k]
     
     def get_salary_range_distribution(self) -> Dict:
         """
@@ -246,27 +405,31 @@ class EmployeeAnalyzer:
         Returns:
             Dict: Count of employees in each salary range
         """
-        ranges = {
-            '0-50k': 0,
-            '50k-70k': 0,
-            '70k-90k': 0,
-            '90k-100k': 0,
-            '100k+': 0
-        }
+        return dict(zip(self.SALARY_RANGE_LABELS, self._salary_bucket_counts().tolist()))
+    
+    def _salary_bucket_counts(self) -> np.ndarray:
+        """Employee count per salary range; each range is [edge, next edge)."""
+        bins = np.searchsorted(self.SALARY_RANGE_EDGES, self.salary, side='right')
+        return np.bincount(bins, minlength=len(self.SALARY_RANGE_LABELS))
+    
+    def _compute_all(self, top_n: int = 10) -> _AnalysisResults:
+        """
+        Collect the aggregates generate_report needs.
         
-        for emp in self.employees:
-            if emp.salary < 50000:
-                ranges['0-50k'] += 1
-            elif emp.salary < 70000:
-                ranges['50k-70k'] += 1
-            elif emp.salary < 90000:
-                ranges['70k-90k'] += 1
-            elif emp.salary < 100000:
-                ranges['90k-100k'] += 1
-            else:
-                ranges['100k+'] += 1
+        Each aggregate is still its own vectorized pass over the column
+        arrays; department statistics come from the cache when available.
         
-        return ranges
+        Args:
+            top_n (int): Number of top performers to select (default: 10)
+            
+        Returns:
+            _AnalysisResults: Department statistics, salary range counts and top indices
+        """
+        return _AnalysisResults(
+            dept_stats=self._department_statistics(),
+            bucket_counts=self._salary_bucket_counts(),
+            top_idx=self._top_indices(top_n)
+        )
     
     def generate_report(self) -> str:
         """
@@ -276,19 +439,21 @@ class EmployeeAnalyzer:
             str: Formatted report text with all analysis results
         """
         lines = []
+        total_employees = self.salary.size
+        results = self._compute_all(10)
         
         # Header
         lines.append("=" * 80)
         lines.append("EMPLOYEE DATA ANALYSIS REPORT")
         lines.append("=" * 80)
         lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(f"Total Employees Analyzed: {len(self.employees)}")
+        lines.append(f"Total Employees Analyzed: {total_employees}")
         lines.append("")
         
         # Department Statistics
         lines.append("DEPARTMENT STATISTICS:")
         lines.append("-" * 80)
-        dept_stats = self.get_department_statistics()
+        dept_stats = results.dept_stats
         
         for dept, stats in sorted(dept_stats.items()):
             lines.append(f"\n{dept}:")
@@ -301,25 +466,29 @@ class EmployeeAnalyzer:
         # Top Performers
         lines.append("TOP 10 PERFORMERS:")
         lines.append("-" * 80)
-        top_performers = self.get_top_performers(10)
+        top_performers = self._emp_array[results.top_idx].tolist()
         
-        for rank, emp in enumerate(top_performers, 1):
-            lines.append(
-                f"{rank:2d}. {emp.name:25s} ({emp.department:12s}) - "
-                f"Score: {emp.performance_score}/10"
-            )
+        lines.append("\n".join(
+            f"{rank:2d}. {emp.name:25s} ({emp.department:12s}) - "
+            f"Score: {emp.performance_score}/10"
+            for rank, emp in enumerate(top_performers, 1)
+        ))
         
         lines.append("")
         
         # Salary Distribution
         lines.append("SALARY DISTRIBUTION:")
         lines.append("-" * 80)
-        salary_dist = self.get_salary_range_distribution()
-        
-        for range_name, count in salary_dist.items():
-            percentage = (count / len(self.employees)) * 100
-            bar = "█" * int(percentage / 2)  # Visual bar
-            lines.append(f"{range_name:12s}: {count:3d} employees ({percentage:5.1f}%) {bar}")
+        counts = results.bucket_counts
+        percentages = (counts / total_employees) * 100
+        bars = np.char.multiply("█", (percentages / 2).astype(int))  # Visual bars
+        
+        lines.extend(
+            f"{range_name:12s}: {count:3d} employees ({percentage:5.1f}%) {bar}"
+            for range_name, count, percentage, bar in zip(
+                self.SALARY_RANGE_LABELS, counts.tolist(), percentages.tolist(), bars.tolist()
+            )
+        )
         
         lines.append("")
         
@@ -327,13 +496,17 @@ class EmployeeAnalyzer:
         lines.append("OVERALL STATISTICS:")
         lines.append("-" * 80)
         
-        all_salaries = [emp.salary for emp in self.employees]
-        all_performances = [emp.performance_score for emp in self.employees]
+        # One reduction per statistic. The median is the upper-middle value
+        # (index n // 2, not the mean of the two middle values), found by a
+        # linear-time partial sort
+        salaries = self.salary
+        middle = total_employees // 2
+        median_salary = np.partition(salaries, middle)[middle]
         
-        lines.append(f"Average Salary (All Departments): ${sum(all_salaries) / len(all_salaries):,.2f}")
-        lines.append(f"Median Salary: ${sorted(all_salaries)[len(all_salaries) // 2]:,.2f}")
-        lines.append(f"Salary Range: ${min(all_salaries):,.2f} - ${max(all_salaries):,.2f}")
-        lines.append(f"Average Performance Score: {sum(all_performances) / len(all_performances):.2f}/10")
+        lines.append(f"Average Salary (All Departments): ${salaries.sum() / total_employees:,.2f}")
+        lines.append(f"Median Salary: ${median_salary:,.2f}")
+        lines.append(f"Salary Range: ${salaries.min():,.2f} - ${salaries.max():,.2f}")
+        lines.append(f"Average Performance Score: {self.performance.sum() / total_employees:.2f}/10")
         
         lines.append("")
         lines.append("=" * 80)
@@ -351,6 +524,12 @@ class FileManager:
     reports to text files.
     """
     
+    # CSV column order, matching the Employee constructor arguments
+    FIELDNAMES = [
+        'emp_id', 'name', 'department',
+        'salary', 'joining_date', 'performance_score'
+    ]
+    
     @staticmethod
     def save_to_csv(employees: List[Employee], filename: str) -> None:
         """
@@ -360,17 +539,24 @@ class FileManager:
             employees (List[Employee]): List of employees to save
             filename (str): Output CSV filename
         """
-        with open(filename, 'w', newline='', encoding='utf-8') as file:
-            fieldnames = [
-                'emp_id', 'name', 'department', 
-                'salary', 'joining_date', 'performance_score'
-            ]
-            
-            writer = csv.DictWriter(file, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for emp in employees:
-                writer.writerow(emp.to_dict())
+        if pa is not None:
+            # Build the table column by column and let Arrow's C writer format it
+            table = pa.table({
+                field: [getattr(emp, field) for emp in employees]
+                for field in FileManager.FIELDNAMES
+            })
+            pacsv.write_csv(table, filename)
+        else:
+            with open(filename, 'w', newline='', encoding='utf-8') as file:
+                writer = csv.writer(file)
+                writer.writerow(FileManager.FIELDNAMES)
+                
+                # Plain tuples avoid building a dict per employee
+                writer.writerows(
+                    (emp.emp_id, emp.name, emp.department,
+                     emp.salary, emp.joining_date, emp.performance_score)
+                    for emp in employees
+                )
         
         print(f"✅ Employee data saved to: {filename}")
     
@@ -399,21 +585,37 @@ class FileManager:
         Returns:
             List[Employee]: List of Employee objects loaded from file
         """
-        employees = []
-        
-        with open(filename, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
+        if pa is not None:
+            # Parse in bulk with Arrow; pin types so dates stay strings, and
+            # disable null markers so bad numbers raise ValueError like float()
+            string_fields = ('emp_id', 'name', 'department', 'joining_date')
+            convert_options = pacsv.ConvertOptions(
+                column_types={
+                    field: pa.string() if field in string_fields else pa.float64()
+                    for field in FileManager.FIELDNAMES
+                },
+                include_columns=FileManager.FIELDNAMES,
+                null_values=[]
+            )
+            table = pacsv.read_csv(filename, convert_options=convert_options)
+            columns = [table[field].to_pylist() for field in FileManager.FIELDNAMES]
+            employees = [Employee(*row) for row in zip(*columns)]
+        else:
+            employees = []
             
-            for row in reader:
-                employee = Employee(
-                    emp_id=row['emp_id'],
-                    name=row['name'],
-                    department=row['department'],
-                    salary=float(row['salary']),
-                    joining_date=row['joining_date'],
-                    performance_score=float(row['performance_score'])
-                )
-                employees.append(employee)
+            with open(filename, 'r', encoding='utf-8') as file:
+                reader = csv.DictReader(file)
+                
+                for row in reader:
+                    employee = Employee(
+                        emp_id=row['emp_id'],
+                        name=row['name'],
+                        department=row['department'],
+                        salary=float(row['salary']),
+                        joining_date=row['joining_date'],
+                        performance_score=float(row['performance_score'])
+                    )
+                    employees.append(employee)
         
         print(f"✅ Loaded {len(employees)} employees from: {filename}")
         return employees